@@ -26,6 +26,7 @@ setup(
     url='https://github.com/hbschr/snapshotbackup',
     install_requires=[
         'argcomplete>=1.11.1',
+        'ciso8601>=2.1.0; python_version < "3.11"',
         'dateparser>=0.7.0',
         'humanfriendly>=4.17',
         'psutil>=5.6.6',
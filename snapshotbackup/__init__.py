@@ -1,60 +1,175 @@
 # PYTHON_ARGCOMPLETE_OK
-import argcomplete
 import argparse
 import configparser
+import functools
+import glob
 import importlib
 import logging
 import os
-import psutil
 import signal
 import sys
 from abc import ABC, abstractmethod
-from pkg_resources import get_distribution
 
 from .worker import Worker
 from .config import parse_config
 from .exceptions import BackupDirError, BackupDirNotFoundError, CommandNotFoundError, ConfigFileNotFound, \
-    LockedError, SourceNotReachableError, SyncFailedError, TimestampParseError
+    ConfigValueError, Error, LockedError, SourceNotReachableError, SyncFailedError, TimestampParseError
 from .subprocess import DEBUG_SHELL
+from .timestamps import get_timestamp
 
-__version__ = get_distribution(__name__).version
 logger = logging.getLogger(__name__)
 
+_proc_path = '/proc'
+
+_commands = {
+    'setup': '_setup', 's': '_setup',
+    'backup': '_backup', 'b': '_backup',
+    'list': '_list', 'l': '_list',
+    'prune': '_prune', 'p': '_prune',
+    'decay': '_decay', 'd': '_decay',
+    'destroy': '_destroy',
+    'clean': '_clean',
+}
+"""commands and their aliases mapped to the name of the :class:`CliApp` method handling them"""
+
+_abort_messages = (
+    (SourceNotReachableError, 'source dir "{e.path}" not found'),
+    (BackupDirNotFoundError, 'backup dir "{e.path}" not found, did you run setup and is it mounted?'),
+    (BackupDirError, '{e}'),
+    (CommandNotFoundError, 'command "{e.command}" not found, mayhap missing software?'),
+    (LockedError, 'sync folder is locked, aborting. try again later or delete "{e.lockfile}"'),
+    (SyncFailedError, 'backup interrupted or failed, "{e.target}" may be in an inconsistent state '
+                      '(rsync error {e.errno}, {e.error_message})'),
+)
+"""errors handled by :meth:`CliApp.__call__` and their abort messages, first match wins (subclasses first)"""
+
+_affirmative_answers = frozenset(('y', 'yes'))
+"""answers accepted as "yes" by :func:`_yes_no_prompt`, compared in lower case"""
+
+
+def _get_descendant_pids(pid):
+    """collect the process ids of all descendants of process `pid` from `/proc/<pid>/task/<tid>/children`.
+
+    :param int pid:
+    :return list: process ids of all descendants, parents before their children, or `None` if the kernel does not
+        provide `children` files (`CONFIG_PROC_CHILDREN`)
+    """
+    if not os.path.exists(f'{_proc_path}/{pid}/task/{pid}/children'):
+        return None
+    pids = []
+    queue = [pid]
+    while queue:
+        for children_file in glob.glob(f'{_proc_path}/{queue.pop(0)}/task/*/children'):
+            try:
+                with open(children_file) as f:
+                    children = [int(_pid) for _pid in f.read().split()]
+            except OSError:
+                # process exited meanwhile
+                continue
+            pids.extend(children)
+            queue.extend(children)
+    return pids
+
+
+@functools.lru_cache(maxsize=None)
+def _get_version():
+    """look up the version number of this package in its installed metadata.
+
+    :return str: version number, `0.0.0` if package is not installed
+    """
+    try:
+        from importlib.metadata import PackageNotFoundError, version
+    except ImportError:  # pragma: no cover
+        # python < 3.8
+        from pkg_resources import get_distribution
+        return get_distribution(__name__).version
+    try:
+        return version(__name__)
+    except PackageNotFoundError:
+        return '0.0.0'
+
+
+def __getattr__(name):
+    """provide `__version__` lazily, see :func:`_get_version`.
+
+    >>> import snapshotbackup
+    >>> isinstance(snapshotbackup.__version__, str)
+    True
+    """
+    if name == '__version__':
+        return _get_version()
+    raise AttributeError(f'module {__name__!r} has no attribute {name!r}')
+
+
+class _VersionAction(argparse.Action):
+    """like argparse's `version` action, but looks up the version number only when the option is given."""
+
+    def __init__(self, option_strings, dest=argparse.SUPPRESS, default=argparse.SUPPRESS, help=None):
+        super().__init__(option_strings=option_strings, dest=dest, default=default, nargs=0, help=help)
+
+    def __call__(self, parser, namespace, values, option_string=None):
+        print(f'{parser.prog} {_get_version()}')
+        parser.exit()
 
-argument_parser = argparse.ArgumentParser()
-argument_parser.add_argument('command', choices=['setup', 's', 'backup', 'b', 'list', 'l', 'prune', 'p', 'decay', 'd',
-                                                 'destroy', 'clean'],
-                             help='setup backup path (`mkdir -p`), make backup, list backups, prune backups not held '
-                                  'by retention policy, decay old backups, destroy all backups or clean backup '
-                                  'directory')
-argument_parser.add_argument('name', help='section name in config file')
-argument_parser.add_argument('-c', '--config', metavar='CONFIGFILE', help='use given config file')
-argument_parser.add_argument('-d', '--debug', action='count', default=0, help='lower logging threshold, may be used '
-                                                                              'thrice')
-argument_parser.add_argument('-p', '--progress', action='store_true', help='print progress on stdout')
-argument_parser.add_argument('-s', '--silent', action='store_true',
-                             help='silent mode: log errors, warnings and `--debug` to journald instead of stdout ('
-                                  'extra dependencies needed, install with `pip install snapshotbackup[journald]`)')
-argument_parser.add_argument('--checksum', action='store_true',
-                             help='detect changes by checksum instead of file size and modification time, '
-                                  'increases disk load significantly (triggers `rsync --checksum`)')
-argument_parser.add_argument('--dry-run', action='store_true', help='pass `--dry-run` to rsync and display rsync '
-                                                                    'output, no changes are made on disk')
-argument_parser.add_argument('--source', help='use given path as source for backup, replaces `source` from config file')
-argument_parser.add_argument('--yes', action='store_true', help='say yes to each question, allows non-interactive '
-                                                                'deletion (prune, decay, destroy)')
-argument_parser.add_argument('-v', '--version', action='version', version=f'%(prog)s {__version__}',
-                             help='print version number and exit')
-argcomplete.autocomplete(argument_parser)
+
+@functools.lru_cache(maxsize=None)
+def _get_argument_parser():
+    """build the argument parser for the cli, it is built once on first use and cached afterwards.
+
+    :return argparse.ArgumentParser:
+    """
+    parser = argparse.ArgumentParser()
+    parser.add_argument('command', choices=_commands.keys(),
+                        help='setup backup path (`mkdir -p`), make backup, list backups, prune backups not held '
+                             'by retention policy, decay old backups, destroy all backups or clean backup '
+                             'directory')
+    parser.add_argument('name', help='section name in config file')
+    parser.add_argument('-c', '--config', metavar='CONFIGFILE', help='use given config file')
+    parser.add_argument('-d', '--debug', action='count', default=0, help='lower logging threshold, may be used '
+                                                                         'thrice')
+    parser.add_argument('-p', '--progress', action='store_true', help='print progress on stdout')
+    parser.add_argument('-s', '--silent', action='store_true',
+                        help='silent mode: log errors, warnings and `--debug` to journald instead of stdout ('
+                             'extra dependencies needed, install with `pip install snapshotbackup[journald]`)')
+    parser.add_argument('--checksum', action='store_true',
+                        help='detect changes by checksum instead of file size and modification time, '
+                             'increases disk load significantly (triggers `rsync --checksum`)')
+    parser.add_argument('--dry-run', action='store_true', help='pass `--dry-run` to rsync and display rsync '
+                                                               'output, no changes are made on disk')
+    parser.add_argument('--source', help='use given path as source for backup, replaces `source` from config file')
+    parser.add_argument('--yes', action='store_true', help='say yes to each question, allows non-interactive '
+                                                           'deletion (prune, decay, destroy)')
+    parser.add_argument('--batch', action='store_true', help='list all backups to delete and ask once instead of '
+                                                             'once per backup (prune, decay, destroy)')
+    parser.add_argument('-v', '--version', action=_VersionAction, help='print version number and exit')
+    return parser
+
+
+def _get_queue_handler(handler):
+    """decouple a slow logging handler from the logging thread. records are put into an in-memory queue and passed to
+    `handler` by a background thread, which is stopped (and the queue drained) at exit.
+
+    :param logging.Handler handler:
+    :return logging.handlers.QueueHandler:
+    """
+    import atexit
+    import logging.handlers
+    import queue
+    log_queue = queue.Queue()
+    listener = logging.handlers.QueueListener(log_queue, handler, respect_handler_level=True)
+    listener.start()
+    atexit.register(listener.stop)
+    return logging.handlers.QueueHandler(log_queue)
 
 
 def _yes_no_prompt(message):
-    """prints message, waits for user input and returns `True` if prompt was answered w/ "yes" or "y".
+    """prints message, waits for user input and returns `True` if prompt was answered w/ "yes" or "y", case and
+    surrounding whitespace are ignored.
 
     :param str message:
     :return bool:
     """
-    return input(f'{message} [y/N] ').lower() in ('y', 'yes')
+    return input(f'{message} [y/N] ').strip().lower() in _affirmative_answers
 
 
 def _yes_prompt(message):
@@ -72,19 +187,33 @@ def _yes_prompt(message):
     return True
 
 
+def _approve_prompt(backup):
+    """returns `True` without asking, used per backup when all deletions are confirmed at once.
+
+    :param str backup:
+    :return bool: True
+
+    >>> from snapshotbackup import _approve_prompt
+    >>> _approve_prompt('backup')
+    True
+    """
+    return True
+
+
 def list_backups(worker):
     """list all backups for given configuration.
 
     :param Worker worker:
     :return: None
     """
-    logger.debug(f'list backups, {worker}')
-    for backup in worker.get_backups():
-        print(f'{backup.isotimestamp}'
-              f'\t{backup.humanfriendly_timedelta()}'
-              f'\t{"weekly" if backup.is_weekly else "daily" if backup.is_daily else ""}'
-              f'\t{"prune candidate" if backup.prune else ""}'
-              f'\t{"decay candidate" if backup.decay else ""}')
+    logger.debug('list backups, %s', worker)
+    now = get_timestamp()
+    sys.stdout.write(''.join(f'{backup.isotimestamp}'
+                             f'\t{backup.humanfriendly_timedelta(now)}'
+                             f'\t{"weekly" if backup.is_weekly else "daily" if backup.is_daily else ""}'
+                             f'\t{"prune candidate" if backup.prune else ""}'
+                             f'\t{"decay candidate" if backup.decay else ""}\n'
+                             for backup in worker.get_backups()))
 
 
 def main():
@@ -94,6 +223,10 @@ def main():
 
     :return: None
     """
+    if '_ARGCOMPLETE' in os.environ:
+        # only import `argcomplete` when invoked for shell completion
+        import argcomplete
+        argcomplete.autocomplete(_get_argument_parser())
     app = CliApp()
     signal.signal(signal.SIGTERM, lambda signal, frame: app.abort('Terminated'))
     try:
@@ -134,14 +267,14 @@ class BaseApp(ABC):
         """configures python logger, aware of custom logging levels.
 
         :param int level: logging level, 0 `warning`, 1 `info`, 2 `debug`, 3 `debug_shell`
-        :param bool journald: redirects log from `stdout` to `journald`
+        :param bool journald: redirects log from `stdout` to `journald`, records are passed on by a background thread
         :return: None
         :exit: calls :func:`snapshotbackup.BaseApp.abort` in case of error
         """
         try:
             handlers = None
             if journald:
-                handlers = [self._get_journald_handler()]
+                handlers = [_get_queue_handler(self._get_journald_handler())]
             level = (logging.WARNING, logging.INFO, logging.DEBUG, DEBUG_SHELL)[level]
             logging.basicConfig(handlers=handlers, level=level)
         except ModuleNotFoundError as e:
@@ -161,7 +294,7 @@ class BaseApp(ABC):
             return parse_config(filepath, section)
         except configparser.NoSectionError as e:
             self.abort(f'configuration for "{e.section}" not found')
-        except (ConfigFileNotFound, TimestampParseError) as e:
+        except (ConfigFileNotFound, ConfigValueError, TimestampParseError) as e:
             self.abort(e)
 
     @abstractmethod
@@ -180,12 +313,23 @@ class CliApp(BaseApp):
     backup_name: str
     """job name, corresponds to config file section name"""
 
-    config: dict = {}
+    config: dict
     """parsed config file"""
 
     delete_prompt: callable
     """prompt to use for deletion of backup snapshots"""
 
+    batch_delete: bool = False
+    """ask once for all deletions instead of once per backup"""
+
+    def __init__(self, name=__name__):
+        """initialize a cli app instance.
+
+        :param str name: name of this app instance
+        """
+        super().__init__(name)
+        self.config = {}
+
     def __call__(self, args=sys.argv[1:]):
         """entry point for this `CliApp`.
 
@@ -193,28 +337,23 @@ class CliApp(BaseApp):
         :return: None
         :exit: calls :func:`snapshotbackup.CliApp.abort` in case of error
         """
-        args = argument_parser.parse_args(args=args)
+        args = _get_argument_parser().parse_args(args=args)
         self.backup_name = args.name
         self._configure_logger(args.debug, args.silent)
         self.config = self._get_config(args.config, self.backup_name)
         if args.source:
             self.config.update({'source': args.source})
         self.delete_prompt = _yes_prompt if args.yes else _yes_no_prompt
+        self.batch_delete = args.batch
         try:
             self._main(args.command, args.checksum, args.dry_run, args.progress)
-        except SourceNotReachableError as e:
-            self.abort(f'source dir "{e.path}" not found')
-        except BackupDirNotFoundError as e:
-            self.abort(f'backup dir "{e.path}" not found, did you run setup and is it mounted?')
-        except BackupDirError as e:
-            self.abort(e)
-        except CommandNotFoundError as e:
-            self.abort(f'command "{e.command}" not found, mayhap missing software?')
-        except LockedError as e:
-            self.abort(f'sync folder is locked, aborting. try again later or delete "{e.lockfile}"')
-        except SyncFailedError as e:
-            self.abort(f'backup interrupted or failed, "{e.target}" may be in an inconsistent state '
-                       f'(rsync error {e.errno}, {e.error_message})')
+        except Error as e:
+            for error_class, message in _abort_messages:
+                if isinstance(e, error_class):
+                    self.abort(message.format(e=e))
+                    break
+            else:
+                raise
 
     def abort(self, error_message):
         """log and exit.
@@ -234,10 +373,17 @@ class CliApp(BaseApp):
         :exit 1: error
         """
         # on SIGTERM subprocesses are not terminated
-        for child in psutil.Process().children(recursive=True):
-            logger.debug(f'terminate child process {child.pid}')
-            child.terminate()
-        logger.error(f'"{self.backup_name}" exit with error: {error_message}')
+        pids = _get_descendant_pids(os.getpid())
+        if pids is None:
+            import psutil  # only needed without `/proc/<pid>/task/<tid>/children`, keep it off the start up
+            pids = [_child.pid for _child in psutil.Process().children(recursive=True)]
+        for pid in pids:
+            logger.debug('terminate child process %s', pid)
+            try:
+                os.kill(pid, signal.SIGTERM)
+            except ProcessLookupError:
+                pass
+        logger.error('"%s" exit with error: %s', self.backup_name, error_message)
         sys.exit(1)
 
     def _main(self, command, checksum, dry_run, progress):
@@ -250,29 +396,42 @@ class CliApp(BaseApp):
         :return: None
         :raise NotImplementedError: in case of unknown command
         """
-        logger.info(f'"{command} {self.backup_name}" start w/ pid "{os.getpid()}"')
+        try:
+            handler = getattr(self, _commands[command])
+        except KeyError:
+            raise NotImplementedError(f'unknown command `{command}`') from None
+        if logger.isEnabledFor(logging.INFO):
+            logger.info('"%s %s" start w/ pid "%s"', command, self.backup_name, os.getpid())
         _config = self.config
         worker = Worker(_config['backups'], retain_all_after=_config['retain_all_after'],
-                        retain_daily_after=_config['retain_daily_after'], decay_before=_config['decay_before'])
-        if command in ['s', 'setup']:
-            worker.setup()
-        elif command in ['b', 'backup']:
-            worker.make_backup(_config['source'], _config['ignore'],
-                               autodecay=_config['autodecay'], autoprune=_config['autoprune'],
-                               checksum=checksum, dry_run=dry_run, progress=progress)
-        elif command in ['l', 'list']:
-            list_backups(worker)
-        elif command in ['d', 'decay']:
-            worker.decay_backups(self.delete_backup_prompt)
-        elif command in ['p', 'prune']:
-            worker.prune_backups(self.delete_backup_prompt)
-        elif command in ['destroy']:
-            worker.destroy_volume(self.delete_backup_prompt)
-        elif command in ['clean']:
-            worker.delete_syncdir()
-        else:
-            raise NotImplementedError(f'unknown command `{command}`')
-        logger.info(f'"{command} {self.backup_name}" exit successful')
+                        retain_daily_after=_config['retain_daily_after'], decay_before=_config['decay_before'],
+                        parallel_deletes=_config['parallel_deletes'], delete_interval=_config['delete_interval'])
+        handler(worker, checksum=checksum, dry_run=dry_run, progress=progress)
+        logger.info('"%s %s" exit successful', command, self.backup_name)
+
+    def _setup(self, worker, **_):
+        worker.setup()
+
+    def _backup(self, worker, checksum, dry_run, progress):
+        _config = self.config
+        worker.make_backup(_config['source'], _config['ignore'],
+                           autodecay=_config['autodecay'], autoprune=_config['autoprune'],
+                           checksum=checksum, dry_run=dry_run, progress=progress)
+
+    def _list(self, worker, **_):
+        list_backups(worker)
+
+    def _prune(self, worker, **_):
+        worker.prune_backups(*self._get_delete_prompts())
+
+    def _decay(self, worker, **_):
+        worker.decay_backups(*self._get_delete_prompts())
+
+    def _destroy(self, worker, **_):
+        worker.destroy_volume(*self._get_delete_prompts(self.destroy_volume_prompt))
+
+    def _clean(self, worker, **_):
+        worker.delete_syncdir()
 
     def delete_backup_prompt(self, backup):
         """
@@ -281,3 +440,31 @@ class CliApp(BaseApp):
         :return bool:
         """
         return self.delete_prompt(f'delete {backup}')
+
+    def delete_backups_prompt(self, backups):
+        """list all given backups and ask once for their deletion.
+
+        :param list backups:
+        :return bool:
+        """
+        sys.stdout.write(''.join(f'{_b}\n' for _b in backups))
+        return self.delete_prompt(f'delete {len(backups)} backups')
+
+    def destroy_volume_prompt(self, backups):
+        """list all given backups and ask once to destroy them along w/ the backup volume.
+
+        :param list backups:
+        :return bool:
+        """
+        sys.stdout.write(''.join(f'{_b}\n' for _b in backups))
+        return self.delete_prompt(f'destroy {self.config["backups"]} and {len(backups)} backups')
+
+    def _get_delete_prompts(self, confirm=None):
+        """get prompts for the deleting functions of :class:`snapshotbackup.worker.Worker`.
+
+        :param callable confirm: confirmation used instead of :meth:`delete_backups_prompt` w/ `--batch`
+        :return tuple: prompt called for each backup and confirmation called once for all backups (or `None`)
+        """
+        if self.batch_delete:
+            return _approve_prompt, confirm or self.delete_backups_prompt
+        return self.delete_backup_prompt, None
@@ -5,8 +5,8 @@ from pathlib import Path
 
 from xdg import (XDG_CONFIG_DIRS, XDG_CONFIG_HOME)
 
-from snapshotbackup.exceptions import ConfigFileNotFound
-from .timestamps import parse_human_readable_relative_dates
+from snapshotbackup.exceptions import ConfigFileNotFound, ConfigValueError
+from .timestamps import get_timestamp, parse_human_readable_relative_dates, parse_human_readable_timespan
 
 
 _config_filename = 'snapshotbackup.ini'
@@ -18,6 +18,8 @@ _defaults = {
     'decay': '1 year',
     'autodecay': '',
     'autoprune': '',
+    'parallel_deletes': '1',
+    'delete_interval': '0',
 }
 
 
@@ -56,6 +58,33 @@ def _parse_bool(line):
     return line in ('true', 'True', '1')
 
 
+def _parse_positive_int(line, option):
+    """parse a string input to a positive integer.
+
+    :param str line:
+    :param str option: name of the option, used in error message
+    :return int:
+    :raise snapshotbackup.exceptions.ConfigValueError: when `line` is not a positive integer
+
+    >>> from snapshotbackup.config import _parse_positive_int
+    >>> _parse_positive_int('2', 'option')
+    2
+    >>> _parse_positive_int('0', 'option')
+    Traceback (most recent call last):
+    snapshotbackup.exceptions.ConfigValueError: ...
+    >>> _parse_positive_int('two', 'option')
+    Traceback (most recent call last):
+    snapshotbackup.exceptions.ConfigValueError: ...
+    """
+    try:
+        value = int(line)
+    except ValueError:
+        value = 0
+    if value < 1:
+        raise ConfigValueError(option, line, 'a positive integer')
+    return value
+
+
 def _parse_ignore(line):
     """get a line of comma seperated values and return items.
 
@@ -89,25 +118,31 @@ def _parse_ignore(line):
 
 
 def parse_config(filepath, section):
-    """parse ini file and return dictionary for given section
+    """parse ini file and return dictionary for given section. all relative dates share the same point of reference.
 
     :param str filepath: path to config file
     :param str section: section in ini file to use
     :return dict:
     :raise configparser.NoSectionError: when given `section` is not found
     :raise snapshotbackup.exceptions.ConfigFileNotFound: when config file cannot be found
+    :raise snapshotbackup.exceptions.ConfigValueError: when an option has an invalid value
     """
+    filepath = _get_config_file(filepath)
     config = configparser.ConfigParser(defaults=_defaults)
-    config.read(_get_config_file(filepath))
+    with open(filepath) as f:
+        config.read_string(f.read(), source=str(filepath))
     if not config.has_section(section):
         raise configparser.NoSectionError(section)
+    now = get_timestamp()
     return {
         'source': config[section]['source'],
         'backups': config[section]['backups'],
         'ignore': _parse_ignore(config[section]['ignore']),
-        'retain_all_after': parse_human_readable_relative_dates(config[section]['retain_all']),
-        'retain_daily_after': parse_human_readable_relative_dates(config[section]['retain_daily']),
-        'decay_before': parse_human_readable_relative_dates(config[section]['decay']),
+        'retain_all_after': parse_human_readable_relative_dates(config[section]['retain_all'], now),
+        'retain_daily_after': parse_human_readable_relative_dates(config[section]['retain_daily'], now),
+        'decay_before': parse_human_readable_relative_dates(config[section]['decay'], now),
         'autodecay': _parse_bool(config[section]['autodecay']),
         'autoprune': _parse_bool(config[section]['autoprune']),
+        'parallel_deletes': _parse_positive_int(config[section]['parallel_deletes'], 'parallel_deletes'),
+        'delete_interval': parse_human_readable_timespan(config[section]['delete_interval']),
     }
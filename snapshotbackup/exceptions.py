@@ -64,6 +64,23 @@ class ConfigFileNotFound(Error):
         super().__init__(f'Configfile not found: {filepath}')
 
 
+class ConfigValueError(Error):
+    """invalid value for an option in config file.
+
+    >>> from snapshotbackup.exceptions import ConfigValueError
+    >>> raise ConfigValueError('option', 'value', 'a positive integer')
+    Traceback (most recent call last):
+    snapshotbackup.exceptions.ConfigValueError: ...
+    """
+    option: str
+    value: str
+
+    def __init__(self, option, value, expected):
+        super().__init__(f'invalid value `{value}` for `{option}`, expected {expected}')
+        self.option = option
+        self.value = value
+
+
 class LockedError(Error):
     """already locked.
 
@@ -1,4 +1,6 @@
 import logging
+import os
+import signal
 import subprocess
 
 from .exceptions import BtrfsSyncError, CommandNotFoundError, SourceNotReachableError, SyncFailedError
@@ -15,7 +17,8 @@ def run(*args, show_output=False):
 
     :param args: command arguments
     :type args: tuple of str
-    :param bool show_output: if `True` shell output will be shown on `stdout` and `stderr`
+    :param bool show_output: if `True` shell output will be shown on `stdout` and `stderr`, otherwise output is only
+        read when logging level `DEBUG_SHELL` is enabled and discarded else
     :raise CommandNotFoundError: if command cannot be found
     :raise subprocess.CalledProcessError: if process exits with a non-zero exit code
     :return: None
@@ -33,23 +36,63 @@ def run(*args, show_output=False):
     Traceback (most recent call last):
     snapshotbackup.exceptions.CommandNotFoundError: ...
     """
-    logger.log(DEBUG_SHELL, f'run {args}, show_output={show_output}')
+    logger.log(DEBUG_SHELL, 'run %s, show_output=%s', args, show_output)
     args = tuple(_a for _a in args if _a is not None)
     try:
-        with subprocess.Popen(args, stdout=subprocess.PIPE, stderr=subprocess.STDOUT, encoding='utf-8') as process:
-            while process.poll() is None:
-                line = process.stdout.readline().rstrip()
-                if line:
-                    logger.log(DEBUG_SHELL, f'subprocess: {line}')
-                    if show_output:
-                        print(line)
-            if process.returncode != 0:
-                raise subprocess.CalledProcessError(process.returncode, args)
+        if show_output or logger.isEnabledFor(DEBUG_SHELL):
+            returncode = _run_and_read_output(args, show_output)
+        else:
+            returncode = _spawn(args)
+        if returncode != 0:
+            raise subprocess.CalledProcessError(returncode, args)
     except FileNotFoundError as e:
-        logger.debug(f'raise `CommandNotFoundError` after catching `{e}`')
+        logger.debug('raise `CommandNotFoundError` after catching `%s`', e)
         raise CommandNotFoundError(e.filename) from e
 
 
+def _spawn(args):
+    """run command with `stdout` and `stderr` redirected to `/dev/null` and wait for it to finish.
+    uses :func:`os.posix_spawnp` where available to avoid the overhead of `fork`, falls back to
+    :func:`subprocess.call` otherwise.
+
+    :param tuple args: command arguments
+    :raise FileNotFoundError: if command cannot be found
+    :return int: exit code of process, negative signal number if it was killed by a signal
+    """
+    if not hasattr(os, 'posix_spawnp'):  # pragma: no cover
+        return subprocess.call(args, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    file_actions = (
+        (os.POSIX_SPAWN_OPEN, 1, os.devnull, os.O_WRONLY, 0),
+        (os.POSIX_SPAWN_DUP2, 1, 2),
+    )
+    # python ignores `SIGPIPE` and `SIGXFSZ`, restore the defaults like :class:`subprocess.Popen` does
+    pid = os.posix_spawnp(args[0], args, os.environ, file_actions=file_actions,
+                          setsigdef=(signal.SIGPIPE, signal.SIGXFSZ))
+    _, status = os.waitpid(pid, 0)
+    if os.WIFSIGNALED(status):
+        return -os.WTERMSIG(status)
+    return os.WEXITSTATUS(status)
+
+
+def _run_and_read_output(args, show_output):
+    """run command, read its output line by line and log it with level `DEBUG_SHELL`.
+
+    :param tuple args: command arguments
+    :param bool show_output: also print each line on `stdout`
+    :raise FileNotFoundError: if command cannot be found
+    :return int: exit code of process
+    """
+    with subprocess.Popen(args, stdout=subprocess.PIPE, stderr=subprocess.STDOUT, encoding='utf-8') as process:
+        # read until eof, polling for the exit code may drop lines still sitting in the pipe
+        for line in process.stdout:
+            line = line.rstrip()
+            if line:
+                logger.log(DEBUG_SHELL, 'subprocess: %s', line)
+                if show_output:
+                    print(line)
+    return process.returncode
+
+
 def is_reachable(path):
     """test if `path` can be reached.
 
@@ -67,20 +110,41 @@ def is_reachable(path):
         raise SourceNotReachableError(path) from e
 
 
+def _is_remote(path):
+    """check if `rsync` will treat given `path` as remote, that is an `rsync://` url or a colon before the first
+    slash (`host:path`, `user@host:path`, `host::module`).
+
+    :param str path:
+    :return bool:
+
+    >>> from snapshotbackup.subprocess import _is_remote
+    >>> _is_remote('/path') or _is_remote('path') or _is_remote('/path/with:colon')
+    False
+    >>> _is_remote('host:/path') and _is_remote('user@host:path') and _is_remote('rsync://host/module')
+    True
+    """
+    return path.startswith('rsync://') or ':' in path.split('/', 1)[0]
+
+
 def rsync(source, target, exclude=(), checksum=False, progress=False, dry_run=False):
     """run `rsync` for given `source` and `target`.
 
     :param str source: path to read from
     :param str target: path to write to
     :param tuple exclude: paths to exclude
+    :param bool checksum: detect changes by checksum instead of file size and modification time
     :param bool progress: show some progress information
+    :param bool dry_run: make no changes, show what rsync would do
     :raise SyncFailedError: when sync is interrupted
     :return: None
     """
-    logger.debug(f'sync `{source}` to `{target}`')
-    args = ['rsync', '--human-readable', '--itemize-changes', '--stats']
-    args.extend(['-azv', '--sparse', '--delete', '--delete-excluded'])
-    args.extend([f'--exclude={path}' for path in exclude])
+    logger.debug('sync `%s` to `%s`', source, target)
+    # delta transfer and compression only pay off over a network, local copies are cheaper w/ whole files
+    args = ['rsync', '-az' if _is_remote(source) else '-aW', '--sparse', '--delete', '--delete-excluded']
+    if progress or dry_run or logger.isEnabledFor(DEBUG_SHELL):
+        # per file output is only worth producing when someone reads it
+        args.extend(['-v', '--human-readable', '--itemize-changes', '--stats'])
+    args.extend([f'--exclude={path}' for path in exclude if path])
     args.extend([f'{source}/', target])
     if checksum:
         args.append('--checksum')
@@ -90,7 +154,7 @@ def rsync(source, target, exclude=(), checksum=False, progress=False, dry_run=Fa
     try:
         run(*args, show_output=progress or dry_run)
     except subprocess.CalledProcessError as e:
-        logger.debug(f'raise `SyncFailedError` after catching `{e}`')
+        logger.debug('raise `SyncFailedError` after catching `%s`', e)
         raise SyncFailedError(target, e.returncode) from e
     if dry_run:
         print('dry run, no changes were made on disk')
@@ -102,7 +166,7 @@ def create_subvolume(path):
     :param str path: filesystem path
     :return: None
     """
-    logger.debug(f'create subvolume `{path}`')
+    logger.debug('create subvolume `%s`', path)
     run('btrfs', 'subvolume', 'create', path)
 
 
@@ -112,7 +176,7 @@ def delete_subvolume(path):
     :param str path: filesystem path
     :return: None
     """
-    logger.debug(f'delete subvolume `{path}`')
+    logger.debug('delete subvolume `%s`', path)
     run('sudo', 'btrfs', 'subvolume', 'delete', path)
 
 
@@ -124,7 +188,7 @@ def make_snapshot(source, target, readonly=True):
     :param bool readonly: if `True` snapshot will not be writable
     :return: None
     """
-    logger.debug(f'create snapshot `{target}`')
+    logger.debug('create snapshot `%s`', target)
     args = 'btrfs', 'subvolume', 'snapshot', '-r' if readonly else None, source, target
     run(*args)
     btrfs_sync(target)
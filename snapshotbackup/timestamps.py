@@ -1,14 +1,31 @@
-import dateparser
+import functools
 import humanfriendly
+import re
+import sys
 from datetime import datetime, timedelta, timezone
 from dateutil.parser import isoparse
 
 from .exceptions import TimestampParseError
 
+if sys.version_info >= (3, 11):
+    _parse_isoformat = datetime.fromisoformat
+else:  # pragma: no cover
+    try:
+        from ciso8601 import parse_datetime as _parse_isoformat
+    except ImportError:
+        _parse_isoformat = isoparse
+
+_isoformat_pattern = re.compile(
+    r'[0-9]{4}-[0-9]{2}-[0-9]{2}T([01][0-9]|2[0-3]):[0-5][0-9]:[0-5][0-9](\.[0-9]{6})?[+-][0-9]{2}:[0-5][0-9]')
+"""shape of `get_timestamp().isoformat()`, only strings of this shape are handed to the fast parser"""
 
 earliest_time = isoparse('0001-01-01T00+00:00')
 """earliest possible datetime, `datetime.min` is not offset-aware"""
 
+_one_hour = timedelta(hours=1)
+_one_day = timedelta(days=1)
+_one_week = timedelta(weeks=1)
+
 
 def get_timestamp():
     """returns a timezone aware `datetime` object for `now`.
@@ -51,8 +68,13 @@ def get_human_readable_timedelta(delta):
     return humanfriendly.format_timespan(seconds, max_units=2)
 
 
+@functools.lru_cache(maxsize=4096)
 def parse_timestamp(string):
     """parse an iso timestamp string, return corresponding `datetime` object.
+    strings shaped like `get_timestamp().isoformat()` are parsed w/ :meth:`datetime.datetime.fromisoformat` on python
+    3.11 and later, the c implementation from `ciso8601` on older versions. both accept more than
+    `dateutil.parser.isoparse` does, so all other strings and those rejected there are handed to `isoparse`.
+    results are memoized, use `parse_timestamp.cache_clear()` to reset.
 
     :param str string: iso timestamp
     :return datetime datetime:
@@ -61,11 +83,36 @@ def parse_timestamp(string):
     >>> from snapshotbackup.timestamps import parse_timestamp
     >>> parse_timestamp('1989-11-09')
     datetime.datetime(1989, 11, 9, 0, 0)
+    >>> parse_timestamp('1989-11-09T00+00')
+    datetime.datetime(1989, 11, 9, 0, 0, tzinfo=tzutc())
+    >>> parse_timestamp('1989-11-09T12:00:00+01:00').utcoffset()
+    datetime.timedelta(seconds=3600)
+    >>> parse_timestamp('2000-01T12:00:00+01:00')
+    Traceback (most recent call last):
+    ...
+    snapshotbackup.exceptions.TimestampParseError: ...
+    >>> parse_timestamp('2020-01-01-12:00:00W+01:00')
+    Traceback (most recent call last):
+    ...
+    snapshotbackup.exceptions.TimestampParseError: ...
+    >>> parse_timestamp('2000-01-01T12:00:00.+01:00')
+    Traceback (most recent call last):
+    ...
+    snapshotbackup.exceptions.TimestampParseError: ...
+    >>> parse_timestamp('2010-01-01T12:00:00+01:70')
+    Traceback (most recent call last):
+    ...
+    snapshotbackup.exceptions.TimestampParseError: ...
     >>> parse_timestamp('some random string')
     Traceback (most recent call last):
     ...
     snapshotbackup.exceptions.TimestampParseError: ...
     """
+    if _isoformat_pattern.fullmatch(string):
+        try:
+            return _parse_isoformat(string)
+        except ValueError:
+            pass
     try:
         return isoparse(string)
     except (ValueError, OverflowError) as e:
@@ -74,27 +121,79 @@ def parse_timestamp(string):
         raise TimestampParseError(str(e), error=e) from e
 
 
-def parse_human_readable_relative_dates(string: str) -> datetime:
+def parse_human_readable_relative_dates(string: str, relative_base: datetime = None) -> datetime:
     """parse human readable relative dates.
 
     :param str string:
+    :param datetime.datetime relative_base: dates are relative to this, defaults to now
     :return datetime datetime:
     :raise TimestampParseError:
 
+    >>> from datetime import datetime, timezone
     >>> from snapshotbackup.timestamps import parse_human_readable_relative_dates
     >>> parse_human_readable_relative_dates('1 day ago')
     datetime.datetime(...)
+    >>> parse_human_readable_relative_dates('1 day ago', datetime(1989, 11, 10, tzinfo=timezone.utc)).date()
+    datetime.date(1989, 11, 9)
     >>> parse_human_readable_relative_dates('anytime')
     Traceback (most recent call last):
     ...
     snapshotbackup.exceptions.TimestampParseError: ...
     """
-    date = dateparser.parse(string, settings={'RETURN_AS_TIMEZONE_AWARE': True})
+    import dateparser  # takes most of the import time of this package, only import it when needed
+    settings = {'RETURN_AS_TIMEZONE_AWARE': True}
+    if relative_base:
+        settings['RELATIVE_BASE'] = relative_base
+    date = dateparser.parse(string, settings=settings)
     if date:
         return date
     raise TimestampParseError(f'could not parse `{string}`')
 
 
+def parse_human_readable_timespan(string):
+    """parse human readable timespan, return seconds.
+
+    :param str string:
+    :return float:
+    :raise TimestampParseError:
+
+    >>> from snapshotbackup.timestamps import parse_human_readable_timespan
+    >>> parse_human_readable_timespan('0')
+    0.0
+    >>> parse_human_readable_timespan('10 minutes')
+    600.0
+    >>> parse_human_readable_timespan('sometimes')
+    Traceback (most recent call last):
+    ...
+    snapshotbackup.exceptions.TimestampParseError: ...
+    """
+    try:
+        return humanfriendly.parse_timespan(string)
+    except humanfriendly.InvalidTimespan as e:
+        raise TimestampParseError(str(e), error=e) from e
+
+
+@functools.lru_cache(maxsize=4096)
+def try_parse_timestamp(string):
+    """parse an iso timestamp string like :func:`parse_timestamp`, but return `None` instead of raising.
+    results are memoized, including negative ones. successful parses also populate the cache of
+    :func:`parse_timestamp`, so a name is parsed only once.
+
+    :param str string: iso timestamp
+    :return datetime.datetime: parsed timestamp or None
+
+    >>> from snapshotbackup.timestamps import try_parse_timestamp
+    >>> try_parse_timestamp('1989-11-09')
+    datetime.datetime(1989, 11, 9, 0, 0)
+    >>> try_parse_timestamp('some random string') is None
+    True
+    """
+    try:
+        return parse_timestamp(string)
+    except TimestampParseError:
+        return None
+
+
 def is_timestamp(string):
     """test if given string is a valid iso timestamp.
 
@@ -107,11 +206,7 @@ def is_timestamp(string):
     >>> is_timestamp('some random string')
     False
     """
-    try:
-        parse_timestamp(string)
-        return True
-    except TimestampParseError:
-        return False
+    return try_parse_timestamp(string) is not None
 
 
 def is_same_hour(date1: datetime, date2: datetime) -> bool:
@@ -131,7 +226,7 @@ def is_same_hour(date1: datetime, date2: datetime) -> bool:
     False
     """
     assert date1 < date2
-    return date1.hour == date2.hour and date2 - date1 < timedelta(hours=1)
+    return date1.hour == date2.hour and date2 - date1 < _one_hour
 
 
 def is_same_day(date1: datetime, date2: datetime) -> bool:
@@ -151,7 +246,7 @@ def is_same_day(date1: datetime, date2: datetime) -> bool:
     False
     """
     assert date1 < date2
-    return date1.day == date2.day and date2 - date1 < timedelta(days=1)
+    return date1.day == date2.day and date2 - date1 < _one_day
 
 
 def is_same_week(date1: datetime, date2: datetime) -> bool:
@@ -169,8 +264,9 @@ def is_same_week(date1: datetime, date2: datetime) -> bool:
     False
     >>> is_same_week(datetime(1970, 1, 1), datetime(1971, 1, 1))
     False
+    >>> is_same_week(datetime(2020, 12, 28), datetime(2021, 1, 3))
+    True
     """
-    _, week1, _ = date1.isocalendar()
-    _, week2, _ = date2.isocalendar()
     assert date1 < date2
-    return week1 == week2 and date2 - date1 < timedelta(weeks=1)
+    # iso weeks start on monday, compare the ordinal of the monday instead of calling `isocalendar()`
+    return date2 - date1 < _one_week and date1.toordinal() - date1.weekday() == date2.toordinal() - date2.weekday()
@@ -137,7 +137,9 @@ class BaseVolume(object):
         >>> with tempfile.TemporaryDirectory() as path:
         ...     BaseVolume(path).setup()
         """
-        os.makedirs(self.path, exist_ok=True)
+        if not os.path.isdir(self.path):
+            # `makedirs` stats the parent and attempts `mkdir` even if the directory exists, one `stat` is enough then
+            os.makedirs(self.path, exist_ok=True)
 
 
 class BtrfsVolume(BaseVolume):
@@ -231,10 +233,11 @@ class Lock(object):
         self._lockfile = os.path.abspath(lockfile)
 
     def __enter__(self):
-        """enter locked context: create lockfile or throw error"""
-        if os.path.isfile(self._lockfile):
-            raise LockedError(self._lockfile)
-        open(self._lockfile, 'w').close()
+        """enter locked context: create lockfile or throw error. checking and creating is one atomic `open`."""
+        try:
+            os.close(os.open(self._lockfile, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o666))
+        except FileExistsError:
+            raise LockedError(self._lockfile) from None
 
     def __exit__(self, exc_type, exc_value, exc_traceback):
         """exit locked context: remove lockfile"""
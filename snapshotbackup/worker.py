@@ -1,5 +1,8 @@
 import logging
 import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 
 from .exceptions import BackupDirNotFoundError
@@ -21,6 +24,12 @@ class Worker(object):
     decay_before: datetime
     """threshold: backups older than this may decay"""
 
+    delete_interval: float
+    """seconds to wait between the start of two deletions"""
+
+    parallel_deletes: int
+    """how many backups may be deleted at once"""
+
     retain_all_after: datetime
     """threshold: backups younger than this are not pruned"""
 
@@ -31,23 +40,28 @@ class Worker(object):
     """instance of :class:`snapshotbackup.volume.BtrfsVolume`"""
 
     def __init__(self, path, retain_all_after=earliest_time, retain_daily_after=earliest_time,
-                 decay_before=earliest_time):
+                 decay_before=earliest_time, parallel_deletes=1, delete_interval=0):
         """populate `self.volume` with a new :class:`snapshotbackup.volume.BtrfsVolume` instance.
 
         :param str path:
         :param datetime.datetime retain_all_after:
         :param datetime.datetime retain_daily_after:
         :param datetime.datetime decay_before:
+        :param int parallel_deletes:
+        :param float delete_interval:
         :raise Error: see :func:`BtrfsVolume.__init__`
         """
         self.volume = BtrfsVolume(path)
         self.decay_before = decay_before
+        self.parallel_deletes = parallel_deletes
+        self.delete_interval = delete_interval
         self.retain_all_after = retain_all_after
         self.retain_daily_after = retain_daily_after
 
     def __repr__(self):
         return f'Worker(path={self.volume.path}, decay_before={self.decay_before}), ' \
-               f'retain_all_after={self.retain_all_after}, retain_daily_after={self.retain_daily_after})'
+               f'retain_all_after={self.retain_all_after}, retain_daily_after={self.retain_daily_after}, ' \
+               f'parallel_deletes={self.parallel_deletes}, delete_interval={self.delete_interval})'
 
     def _assert_syncdir(self):
         """assert existence of syncdir, create if not present.
@@ -84,8 +98,8 @@ class Worker(object):
         :param bool progress:
         :return: timestamp of snapshot or None
         """
-        logger.debug(f'make backup, source_dir={source_dir}, ignore={ignore}, autodecay={autodecay}, '
-                     f'autoprune={autoprune}, checksum={checksum}, dry_run={dry_run}, progress={progress}, {self}')
+        logger.debug('make backup, source_dir=%s, ignore=%s, autodecay=%s, autoprune=%s, checksum=%s, dry_run=%s, '
+                     'progress=%s, %r', source_dir, ignore, autodecay, autoprune, checksum, dry_run, progress, self)
         snapshot_timestamp = None
         is_reachable(source_dir)
         self._assert_syncdir()
@@ -108,15 +122,11 @@ class Worker(object):
         :rtype: [snapshotbackup.backup.Backup]
         """
         self.volume.assure_path()
-        dirs = []
-        for _root, _dirs, _files in os.walk(self.volume.path):
-            dirs = [_dir for _dir in _dirs if is_timestamp(_dir)]
-            break
-
-        dirs.sort()
+        with os.scandir(self.volume.path) as entries:
+            dirs = sorted(_entry.name for _entry in entries if _entry.is_dir() and is_timestamp(_entry.name))
         backups = []
         for _index, _dir in enumerate(dirs):
-            previous = backups[len(backups) - 1] if len(backups) > 0 else None
+            previous = backups[-1] if backups else None
             backups.append(Backup(_dir, self.retain_all_after, self.retain_daily_after, self.decay_before,
                                   previous=previous, is_last=_index == len(dirs) - 1))
         return backups
@@ -132,51 +142,104 @@ class Worker(object):
         except (BackupDirNotFoundError, IndexError):
             return None
 
+    def _delete_backups(self, backups):
+        """delete given backups, up to `self.parallel_deletes` at once. deletions start at least
+        `self.delete_interval` seconds apart, so btrfs' cleaner can catch up in between. when interrupted or after a
+        failed deletion no further deletion is started, waiting for the next one is cut short.
+
+        :param list backups: backups to delete
+        :return: None
+        """
+        lock = threading.Lock()
+        stop = threading.Event()
+        next_start = time.monotonic()
+
+        def delete(name):
+            nonlocal next_start
+            with lock:
+                stop.wait(max(0, next_start - time.monotonic()))
+                next_start = time.monotonic() + self.delete_interval
+            if stop.is_set():
+                return
+            try:
+                self.volume.delete_subvolume(name)
+            except BaseException:
+                # set before this thread picks up the next queued deletion
+                stop.set()
+                raise
+
+        with ThreadPoolExecutor(max_workers=self.parallel_deletes) as executor:
+            try:
+                list(executor.map(delete, [_b.name for _b in backups]))
+            except BaseException:
+                # the executor waits for running threads on exit, let them return without deleting
+                stop.set()
+                raise
+
     def delete_syncdir(self):
         """deletes sync dir when found, otherwise nothing.
 
         :return: None
         """
-        logger.debug(f'delete sync dir, {self}')
+        logger.debug('delete sync dir, %r', self)
         self.volume.assure_writable()
         if os.path.isdir(self.volume.sync_path):
             self.volume.delete_subvolume(self.volume.sync_path)
 
-    def destroy_volume(self, prompt):
+    def _select_backups(self, backups, prompt, confirm):
+        """ask `prompt` for each backup, then `confirm` once for all approved backups.
+
+        :param iterable backups: deletion candidates
+        :param callable prompt: will be called for each backup, must return `True` to authenticate.
+        :param callable confirm: will be called once w/ the list of approved backups, must return `True` to
+            authenticate. not called if nothing is approved.
+        :return list: backups to delete
+        """
+        backups = [_b for _b in backups if prompt(_b)]
+        if backups and confirm and not confirm(backups):
+            return []
+        return backups
+
+    def destroy_volume(self, prompt, confirm=None):
         """deletes all backups and the volume path. i repeat: deletes all data!
+        all prompts are answered before the first backup gets deleted.
 
+        :param callable prompt: will be called for each deletion, must return `True` to authenticate.
+        :param callable confirm: will be called once w/ the list of approved backups, also when it is empty, must return
+            `True` to delete them and the volume path
         :return: None
         """
-        logger.warning(f'delete all backups, {self}')
+        logger.warning('delete all backups, %r', self)
+        backups = [_b for _b in self.get_backups() if prompt(_b)]
+        if confirm and not confirm(backups):
+            return
         self.delete_syncdir()
-        for backup in self.get_backups():
-            if prompt(backup):
-                self.volume.delete_subvolume(backup.name)
+        self._delete_backups(backups)
         os.rmdir(self.volume.path)
 
-    def decay_backups(self, prompt):
+    def decay_backups(self, prompt, confirm=None):
         """delete all backups which are older than `decay` retention policy.
+        all prompts are answered before the first backup gets deleted.
 
         :param callable prompt: will be called for each deletion, must return `True` to authenticate.
+        :param callable confirm: will be called once w/ the list of approved backups, must return `True` to delete them
         :return: None
         """
-        logger.debug(f'decay backups, {self}')
+        logger.debug('decay backups, %r', self)
         self.volume.assure_writable()
-        for to_decay in [_b for _b in self.get_backups() if _b.decay]:
-            if prompt(to_decay):
-                self.volume.delete_subvolume(to_decay.name)
+        self._delete_backups(self._select_backups((_b for _b in self.get_backups() if _b.decay), prompt, confirm))
 
-    def prune_backups(self, prompt):
+    def prune_backups(self, prompt, confirm=None):
         """delete all backups which are not held by `retain_*` retention policy.
+        all prompts are answered before the first backup gets deleted.
 
         :param callable prompt: will be called for each deletion, must return `True` to authenticate.
+        :param callable confirm: will be called once w/ the list of approved backups, must return `True` to delete them
         :return: None
         """
-        logger.debug(f'prune backups, {self}')
+        logger.debug('prune backups, %r', self)
         self.volume.assure_writable()
-        for to_be_pruned in [_b for _b in self.get_backups() if _b.prune]:
-            if prompt(to_be_pruned):
-                self.volume.delete_subvolume(to_be_pruned.name)
+        self._delete_backups(self._select_backups((_b for _b in self.get_backups() if _b.prune), prompt, confirm))
 
 
 class Backup(object):
@@ -298,8 +361,13 @@ class Backup(object):
         """
         return f'Backup {self.isotimestamp} ({self.humanfriendly_timedelta()} ago)'
 
-    def humanfriendly_timedelta(self):
-        return get_human_readable_timedelta(get_timestamp() - self.datetime)
+    def humanfriendly_timedelta(self, now=None):
+        """return human readable age of this backup.
+
+        :param datetime.datetime now: point of reference, defaults to :func:`snapshotbackup.timestamps.get_timestamp`
+        :return str:
+        """
+        return get_human_readable_timedelta((now or get_timestamp()) - self.datetime)
 
     def is_before(self, timestamp):
         """check if this backup completed before given timestamp.
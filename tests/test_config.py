@@ -1,10 +1,13 @@
+import configparser
 import os
 
 import pytest
+from datetime import datetime, timedelta, timezone
 from pathlib import Path
+from unittest.mock import patch
 
-from snapshotbackup.exceptions import ConfigFileNotFound
-from snapshotbackup.config import _config_basepaths, _config_filename, _get_config_file
+from snapshotbackup.exceptions import ConfigFileNotFound, ConfigValueError
+from snapshotbackup.config import _config_basepaths, _config_filename, _get_config_file, parse_config
 
 
 @pytest.fixture
@@ -38,3 +41,33 @@ def test_config(patched_basepaths):
     os.makedirs(patched_basepaths[0], exist_ok=True)
     open(configfile0, 'w').close()
     assert _get_config_file() == configfile0
+
+
+def test_parse_config_section_not_found(tmpdir):
+    configfile = tmpdir / _config_filename
+    with open(configfile, 'w') as f:
+        f.write('[test]\nsource = /source\nbackups = /backups\n')
+    assert parse_config(configfile, 'test')['source'] == '/source'
+    with pytest.raises(configparser.NoSectionError):
+        parse_config(configfile, 'nope')
+
+
+def test_parse_config_relative_dates(tmpdir):
+    configfile = tmpdir / _config_filename
+    with open(configfile, 'w') as f:
+        f.write('[test]\nsource = /source\nbackups = /backups\nretain_all = 1 day\n')
+    now = datetime(2020, 1, 2, tzinfo=timezone.utc)
+    with patch('snapshotbackup.config.get_timestamp', return_value=now):
+        assert parse_config(configfile, 'test')['retain_all_after'] == now - timedelta(days=1)
+    later = now + timedelta(hours=1)
+    with patch('snapshotbackup.config.get_timestamp', return_value=later):
+        assert parse_config(configfile, 'test')['retain_all_after'] == later - timedelta(days=1)
+
+
+@pytest.mark.parametrize('value', ['0', '-1', 'two'])
+def test_parse_config_invalid_parallel_deletes(tmpdir, value):
+    configfile = tmpdir / _config_filename
+    with open(configfile, 'w') as f:
+        f.write(f'[test]\nsource = /source\nbackups = /backups\nparallel_deletes = {value}\n')
+    with pytest.raises(ConfigValueError):
+        parse_config(configfile, 'test')
@@ -1,3 +1,4 @@
+import logging
 import pytest
 import signal
 from unittest.mock import MagicMock, Mock, patch
@@ -20,6 +21,15 @@ class Test_main(object):
         mocked_App.assert_called_once()
         mocked_App().assert_called_once()
 
+    @patch('argcomplete.autocomplete')
+    @patch('snapshotbackup.CliApp')
+    def test_main_argcomplete(self, mocked_App, mocked_autocomplete, monkeypatch):
+        snapshotbackup.main()
+        mocked_autocomplete.assert_not_called()
+        monkeypatch.setenv('_ARGCOMPLETE', '1')
+        snapshotbackup.main()
+        mocked_autocomplete.assert_called_once_with(snapshotbackup._get_argument_parser())
+
     @patch('signal.signal')
     @patch('snapshotbackup.CliApp')
     def test_main_signal_handler(self, mocked_App, mocked_signal):
@@ -46,6 +56,61 @@ class Test_main(object):
         mockedApp().abort.assert_called_once()
 
 
+def test_get_argument_parser_cached():
+    parser = snapshotbackup._get_argument_parser()
+    assert parser is snapshotbackup._get_argument_parser()
+    args = parser.parse_args(['list', 'name'])
+    assert args.command == 'list'
+    assert args.name == 'name'
+    with pytest.raises(SystemExit):
+        parser.parse_args(['not-a-command', 'name'])
+
+
+def test_version(capsys):
+    with pytest.raises(SystemExit) as excinfo:
+        snapshotbackup._get_argument_parser().parse_args(['--version'])
+    assert excinfo.value.code == 0
+    out, _ = capsys.readouterr()
+    assert out.endswith(f' {snapshotbackup.__version__}\n')
+
+
+def test_version_not_installed():
+    metadata = pytest.importorskip('importlib.metadata')
+    snapshotbackup._get_version.cache_clear()
+    try:
+        with patch('importlib.metadata.version', side_effect=metadata.PackageNotFoundError):
+            assert snapshotbackup._get_version() == '0.0.0'
+    finally:
+        snapshotbackup._get_version.cache_clear()
+
+
+def test_unknown_module_attribute():
+    with pytest.raises(AttributeError):
+        snapshotbackup.not_an_attribute
+
+
+def test_get_descendant_pids(tmp_path):
+    for pid, tid, children in ((1, 1, '2 3'), (1, 4, '5 '), (2, 2, ''), (3, 3, '6'), (5, 5, ''), (6, 6, '')):
+        (tmp_path / str(pid) / 'task' / str(tid)).mkdir(parents=True, exist_ok=True)
+        (tmp_path / str(pid) / 'task' / str(tid) / 'children').write_text(children)
+    with patch('snapshotbackup._proc_path', str(tmp_path)):
+        assert sorted(snapshotbackup._get_descendant_pids(1)) == [2, 3, 5, 6]
+        assert snapshotbackup._get_descendant_pids(3) == [6]
+        assert snapshotbackup._get_descendant_pids(7) is None
+
+
+def test_get_queue_handler():
+    records = []
+    handler = logging.Handler()
+    handler.emit = records.append
+    with patch('atexit.register') as mocked_register:
+        queue_handler = snapshotbackup._get_queue_handler(handler)
+    queue_handler.handle(logging.makeLogRecord({'msg': 'message', 'levelno': logging.INFO}))
+    stop_listener, = mocked_register.call_args[0]
+    stop_listener()
+    assert [_r.getMessage() for _r in records] == ['message']
+
+
 def test_yes_no_prompt():
     with patch('builtins.input', return_value='y'):
         assert snapshotbackup._yes_no_prompt('message') is True
@@ -55,6 +120,8 @@ def test_yes_no_prompt():
         assert snapshotbackup._yes_no_prompt('message') is True
     with patch('builtins.input', return_value='YES'):
         assert snapshotbackup._yes_no_prompt('message') is True
+    with patch('builtins.input', return_value=' yes '):
+        assert snapshotbackup._yes_no_prompt('message') is True
     with patch('builtins.input'):
         assert snapshotbackup._yes_no_prompt('message') is False
     with patch('builtins.input', return_value=''):
@@ -63,13 +130,19 @@ def test_yes_no_prompt():
         assert snapshotbackup._yes_no_prompt('message') is False
     with patch('builtins.input', return_value='no'):
         assert snapshotbackup._yes_no_prompt('message') is False
+    with patch('builtins.input', return_value='yolo'):
+        assert snapshotbackup._yes_no_prompt('message') is False
 
 
-def test_list_backups():
+def test_list_backups(capsys):
     mocked_worker = MagicMock()
     mocked_worker.get_backups.return_value = [MagicMock(), MagicMock()]
     list_backups(mocked_worker)
     mocked_worker.get_backups.assert_called_once()
+    out, _ = capsys.readouterr()
+    lines = out.splitlines()
+    assert len(lines) == 2
+    assert lines[0].split('\t')[2:] == ['weekly', 'prune candidate', 'decay candidate']
 
 
 class TestApp(object):
@@ -98,14 +171,16 @@ class TestApp(object):
         _, kwargs = mocked_basic_config.call_args
         assert kwargs.get('handlers') is None
 
+    @patch('snapshotbackup._get_queue_handler')
     @patch('logging.basicConfig')
-    def test_configure_logger_journald(self, mocked_basic_config):
+    def test_configure_logger_journald(self, mocked_basic_config, mocked_queue_handler):
         self.app._get_journald_handler = Mock()
         self.app._configure_logger(0, True)
         mocked_basic_config.assert_called_once()
         _, kwargs = mocked_basic_config.call_args
         assert isinstance(kwargs.get('handlers'), list) and len(kwargs.get('handlers')) == 1
-        assert kwargs.get('handlers')[0] == self.app._get_journald_handler()
+        assert kwargs.get('handlers')[0] == mocked_queue_handler()
+        mocked_queue_handler.assert_any_call(self.app._get_journald_handler())
 
     def test_configure_logger_import_fail(self):
         self.app._get_journald_handler = Mock(side_effect=ModuleNotFoundError('message'))
@@ -130,3 +205,94 @@ class TestApp(object):
     def test_cli_app_main(self, _):
         with pytest.raises(NotImplementedError):
             self.app._main('not-implementd', False, False, False)
+
+
+@patch('snapshotbackup.Worker')
+def test_cli_app_dispatch(mocked_worker):
+    app = snapshotbackup.CliApp()
+    app.backup_name = 'test_backup_name'
+    app.config = MagicMock()
+    app.delete_prompt = Mock()
+    for command, method in (('s', 'setup'), ('setup', 'setup'), ('p', 'prune_backups'), ('d', 'decay_backups'),
+                            ('destroy', 'destroy_volume'), ('clean', 'delete_syncdir')):
+        mocked_worker.reset_mock()
+        app._main(command, False, False, False)
+        getattr(mocked_worker(), method).assert_called_once()
+    app._main('b', True, False, True)
+    _, kwargs = mocked_worker().make_backup.call_args
+    assert kwargs['checksum'] and not kwargs['dry_run'] and kwargs['progress']
+    with pytest.raises(NotImplementedError):
+        app._main('not-implemented', False, False, False)
+
+
+def test_cli_app_config_per_instance():
+    app = snapshotbackup.CliApp()
+    app.config['source'] = '/source'
+    assert snapshotbackup.CliApp().config == {}
+
+
+@pytest.mark.parametrize('error, message', [
+    (snapshotbackup.SourceNotReachableError('/source'), 'source dir "/source" not found'),
+    (snapshotbackup.BackupDirNotFoundError('/backups'), 'backup dir "/backups" not found, did you run setup and is it '
+                                                        'mounted?'),
+    (snapshotbackup.LockedError('/lockfile'), 'sync folder is locked, aborting. try again later or delete '
+                                              '"/lockfile"'),
+])
+@patch('snapshotbackup.parse_config', return_value={})
+@patch('logging.basicConfig')
+def test_cli_app_abort_messages(_, __, error, message):
+    app = snapshotbackup.CliApp()
+    app.abort = Mock()
+    app._main = Mock(side_effect=error)
+    app(['list', 'name'])
+    app.abort.assert_called_once_with(message)
+
+
+@patch('snapshotbackup.parse_config', return_value={})
+@patch('logging.basicConfig')
+def test_cli_app_unhandled_error(_, __):
+    app = snapshotbackup.CliApp()
+    app.abort = Mock()
+    app._main = Mock(side_effect=snapshotbackup.ConfigFileNotFound('/config'))
+    with pytest.raises(snapshotbackup.ConfigFileNotFound):
+        app(['list', 'name'])
+    app.abort.assert_not_called()
+
+
+@patch('snapshotbackup.parse_config',
+       side_effect=snapshotbackup.ConfigValueError('parallel_deletes', '0', 'a positive integer'))
+def test_cli_app_config_value_error(_):
+    app = snapshotbackup.CliApp()
+    app.abort = Mock(side_effect=SystemExit)
+    with pytest.raises(SystemExit):
+        app._get_config(None, 'name')
+    app.abort.assert_called_once()
+
+
+def test_cli_app_batch_delete(capsys):
+    app = snapshotbackup.CliApp()
+    app.delete_prompt = Mock(return_value=True)
+    worker = MagicMock()
+    app._prune(worker)
+    worker.prune_backups.assert_called_once_with(app.delete_backup_prompt, None)
+    app.batch_delete = True
+    app._prune(worker)
+    prompt, confirm = worker.prune_backups.call_args[0]
+    assert prompt is snapshotbackup._approve_prompt
+    assert confirm(['backup1', 'backup2']) is True
+    app.delete_prompt.assert_called_once_with('delete 2 backups')
+    out, _ = capsys.readouterr()
+    assert out == 'backup1\nbackup2\n'
+
+
+def test_cli_app_batch_destroy():
+    app = snapshotbackup.CliApp()
+    app.config['backups'] = '/backups'
+    app.delete_prompt = Mock(return_value=False)
+    app.batch_delete = True
+    worker = MagicMock()
+    app._destroy(worker)
+    prompt, confirm = worker.destroy_volume.call_args[0]
+    assert prompt is snapshotbackup._approve_prompt
+    assert confirm([]) is False
+    app.delete_prompt.assert_called_once_with('destroy /backups and 0 backups')
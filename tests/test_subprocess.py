@@ -1,5 +1,6 @@
 import os.path
 import pytest
+import signal
 import subprocess
 from unittest.mock import patch
 
@@ -62,6 +63,48 @@ def test_rsync_interrupted(mocked_run):
     mocked_run.assert_called_once()
 
 
+@patch('snapshotbackup.subprocess.run')
+def test_rsync_quiet(mocked_run):
+    snapshotbackup.subprocess.rsync('source', 'target')
+    args, kwargs = mocked_run.call_args_list[0]
+    assert '-v' not in args
+    assert '--itemize-changes' not in args
+    assert kwargs.get('show_output') is False
+
+
+@patch('snapshotbackup.subprocess.run')
+def test_rsync_progress(mocked_run):
+    snapshotbackup.subprocess.rsync('source', 'target', progress=True)
+    args, kwargs = mocked_run.call_args_list[0]
+    assert '-v' in args
+    assert '--itemize-changes' in args
+    assert kwargs.get('show_output') is True
+
+
+@patch('snapshotbackup.subprocess.run')
+def test_rsync_local(mocked_run):
+    snapshotbackup.subprocess.rsync('/source', 'target')
+    args, _ = mocked_run.call_args_list[0]
+    assert '-aW' in args
+    assert '-az' not in args
+
+
+@patch('snapshotbackup.subprocess.run')
+def test_rsync_remote(mocked_run):
+    snapshotbackup.subprocess.rsync('user@host:/source', 'target')
+    args, _ = mocked_run.call_args_list[0]
+    assert '-az' in args
+    assert '-aW' not in args
+
+
+@patch('snapshotbackup.subprocess.run')
+def test_rsync_exclude(mocked_run):
+    snapshotbackup.subprocess.rsync('source', 'target', exclude=('/.cache', ''))
+    args, _ = mocked_run.call_args_list[0]
+    assert '--exclude=/.cache' in args
+    assert '--exclude=' not in args
+
+
 @patch('snapshotbackup.subprocess.run')
 def test_rsync_checksum(mocked_run):
     snapshotbackup.subprocess.rsync('source', 'target', checksum=True)
@@ -128,3 +171,23 @@ def test_btrfs_sync_failed(mocked_run):
         snapshotbackup.subprocess.btrfs_sync('path')
     assert excinfo.value.path == 'path'
     mocked_run.assert_called_once()
+
+
+def test_spawn_exit_code():
+    assert snapshotbackup.subprocess._spawn(('true',)) == 0
+    assert snapshotbackup.subprocess._spawn(('sh', '-c', 'exit 3')) == 3
+    assert snapshotbackup.subprocess._spawn(('sh', '-c', 'kill -TERM $$')) == -15
+    assert snapshotbackup.subprocess._spawn(('sh', '-c', 'kill -PIPE $$')) == -signal.SIGPIPE
+
+
+def test_spawn_discards_output(capfd):
+    snapshotbackup.subprocess._spawn(('sh', '-c', 'echo out; echo err >&2'))
+    out, err = capfd.readouterr()
+    assert out == ''
+    assert err == ''
+
+
+def test_run_not_silent_reads_all_output(capsys):
+    snapshotbackup.subprocess.run('sh', '-c', 'echo 1; echo 2; echo 3', show_output=True)
+    out, _ = capsys.readouterr()
+    assert out == '1\n2\n3\n'
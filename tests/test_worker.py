@@ -1,5 +1,8 @@
 import os
 import pytest
+import signal
+import threading
+import time
 from unittest.mock import patch, Mock
 
 from snapshotbackup.exceptions import SyncFailedError
@@ -143,7 +146,7 @@ def test_worker_get_backups(_, tmpdir):
     assert last.name == '1989-11-10T00+00'
 
 
-@patch('os.walk')
+@patch('os.scandir')
 def test_worker_get_backups_missing_branch(_, tmpdir):
     worker = Worker(tmpdir)
     assert len(worker.get_backups()) == 0
@@ -299,3 +302,117 @@ def test_worker_destroy_volume_rejected(mocked_rmdir, _):
     worker.get_backups = Mock(return_value=[mocked_backup])
     worker.destroy_volume(lambda x: False)
     worker.volume.delete_subvolume.assert_not_called()
+
+
+@patch('snapshotbackup.worker.BtrfsVolume')
+def test_worker_prune_backups_parallel(_):
+    worker = Worker('/path', parallel_deletes=2)
+    mocked_backups = [Mock(), Mock(), Mock()]
+    worker.get_backups = Mock(return_value=mocked_backups)
+    worker.prune_backups(lambda x: True)
+    assert worker.volume.delete_subvolume.call_count == 3
+    deleted = {args[0] for args, _ in worker.volume.delete_subvolume.call_args_list}
+    assert deleted == {_b.name for _b in mocked_backups}
+
+
+@patch('snapshotbackup.worker.BtrfsVolume')
+def test_worker_prune_backups_prompts_first(_):
+    worker = Worker('/path')
+    worker.get_backups = Mock(return_value=[Mock(), Mock()])
+    prompt = Mock(return_value=True)
+
+    def delete_subvolume(name):
+        assert prompt.call_count == 2
+
+    worker.volume.delete_subvolume.side_effect = delete_subvolume
+    worker.prune_backups(prompt)
+    assert worker.volume.delete_subvolume.call_count == 2
+
+
+@patch('snapshotbackup.worker.BtrfsVolume')
+def test_worker_delete_backups_stops_after_failure(_):
+    worker = Worker('/path')
+
+    def delete_subvolume(name):
+        time.sleep(.01)  # let the main thread wait for the result, like a real `btrfs` call does
+        raise Exception('delete failed')
+
+    worker.volume.delete_subvolume.side_effect = delete_subvolume
+    with pytest.raises(Exception):
+        worker._delete_backups([Mock(), Mock(), Mock()])
+    worker.volume.delete_subvolume.assert_called_once()
+
+
+@patch('snapshotbackup.worker.BtrfsVolume')
+def test_worker_delete_backups_interrupted(_):
+    worker = Worker('/path', delete_interval=600)
+    timer = threading.Timer(.1, signal.pthread_kill, (threading.get_ident(), signal.SIGINT))
+    timer.start()
+    start = time.monotonic()
+    with pytest.raises(KeyboardInterrupt):
+        worker._delete_backups([Mock(), Mock()])
+    assert time.monotonic() - start < 60
+    worker.volume.delete_subvolume.assert_called_once()
+
+
+@patch('snapshotbackup.worker.BtrfsVolume')
+@patch('snapshotbackup.worker.threading')
+def test_worker_prune_backups_interval(mocked_threading, _):
+    mocked_threading.Lock = threading.Lock
+    stop = mocked_threading.Event()
+    stop.is_set.return_value = False
+    worker = Worker('/path', delete_interval=600)
+    worker.get_backups = Mock(return_value=[Mock(), Mock()])
+    worker.prune_backups(lambda x: True)
+    assert worker.volume.delete_subvolume.call_count == 2
+    delays = [args[0] for args, _ in stop.wait.call_args_list]
+    assert delays[0] == 0
+    assert delays[1] > 599
+
+
+@patch('snapshotbackup.worker.BtrfsVolume')
+def test_worker_prune_backups_confirm(_):
+    worker = Worker('/path')
+    mocked_backups = [Mock(), Mock()]
+    worker.get_backups = Mock(return_value=mocked_backups)
+    confirm = Mock(return_value=False)
+    worker.prune_backups(lambda x: True, confirm)
+    confirm.assert_called_once_with(mocked_backups)
+    worker.volume.delete_subvolume.assert_not_called()
+    confirm.return_value = True
+    worker.prune_backups(lambda x: True, confirm)
+    assert worker.volume.delete_subvolume.call_count == 2
+
+
+@patch('snapshotbackup.worker.BtrfsVolume')
+def test_worker_decay_backups_confirm_nothing(_):
+    worker = Worker('/path')
+    worker.get_backups = Mock(return_value=[Mock(decay=False)])
+    confirm = Mock()
+    worker.decay_backups(lambda x: True, confirm)
+    confirm.assert_not_called()
+
+
+@patch('snapshotbackup.worker.BtrfsVolume')
+@patch('os.rmdir')
+def test_worker_destroy_volume_not_confirmed(mocked_rmdir, _):
+    worker = Worker('/path')
+    worker.get_backups = Mock(return_value=[Mock()])
+    worker.destroy_volume(lambda x: True, lambda backups: False)
+    worker.volume.delete_subvolume.assert_not_called()
+    mocked_rmdir.assert_not_called()
+
+
+@patch('snapshotbackup.worker.BtrfsVolume')
+@patch('os.rmdir')
+def test_worker_destroy_volume_empty(mocked_rmdir, _):
+    worker = Worker('/path')
+    worker.get_backups = Mock(return_value=[])
+    confirm = Mock(return_value=False)
+    worker.destroy_volume(lambda x: True, confirm)
+    confirm.assert_called_once_with([])
+    mocked_rmdir.assert_not_called()
+    confirm.return_value = True
+    worker.destroy_volume(lambda x: True, confirm)
+    worker.volume.delete_subvolume.assert_not_called()
+    mocked_rmdir.assert_called_once()